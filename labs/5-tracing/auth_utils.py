@@ -0,0 +1,76 @@
+"""Shared Microsoft Entra ID helpers for the tracing notebooks."""
+from functools import cache
+from typing import Awaitable, Callable
+
+from azure.identity import DefaultAzureCredential, get_bearer_token_provider
+from azure.identity.aio import DefaultAzureCredential as AsyncDefaultAzureCredential
+from azure.identity.aio import get_bearer_token_provider as get_async_bearer_token_provider
+
+COGNITIVE_SERVICES_SCOPE = "https://cognitiveservices.azure.com/.default"
+
+# Interactive browser and VS Code sign-in only add cold-start latency in a notebook kernel.
+_CREDENTIAL_OPTIONS = {
+    "exclude_interactive_browser_credential": True,
+    "exclude_visual_studio_code_credential": True,
+}
+
+
+@cache
+def get_credential() -> DefaultAzureCredential:
+    """
+    Return the process-wide credential so the credential chain is only probed once.
+    """
+    return DefaultAzureCredential(**_CREDENTIAL_OPTIONS)
+
+
+@cache
+def get_async_credential() -> AsyncDefaultAzureCredential:
+    """
+    Return the process-wide async credential used by the async Azure OpenAI clients.
+    """
+    return AsyncDefaultAzureCredential(**_CREDENTIAL_OPTIONS)
+
+
+@cache
+def get_token_provider(scope: str = COGNITIVE_SERVICES_SCOPE) -> Callable[[], str]:
+    """
+    Return a bearer token provider for the given scope.
+
+    Args:
+        scope (str): The token scope. Defaults to Azure OpenAI / Cognitive Services.
+
+    Returns:
+        Callable[[], str]: A provider that returns a cached token, refreshing it when it expires.
+    """
+    return get_bearer_token_provider(get_credential(), scope)
+
+
+@cache
+def get_async_token_provider(scope: str = COGNITIVE_SERVICES_SCOPE) -> Callable[[], Awaitable[str]]:
+    """
+    Return an async bearer token provider for the given scope.
+
+    Token acquisition and refreshes are awaited, so they never block the event loop
+    that the notebooks' concurrent agent sessions share.
+
+    Args:
+        scope (str): The token scope. Defaults to Azure OpenAI / Cognitive Services.
+
+    Returns:
+        Callable[[], Awaitable[str]]: A coroutine provider that returns a cached token.
+    """
+    return get_async_bearer_token_provider(get_async_credential(), scope)
+
+
+async def close_credentials() -> None:
+    """
+    Close the cached async credential and forget it, along with the providers built on it.
+
+    The async credential owns an aiohttp session that is otherwise only released at
+    interpreter exit, with an "Unclosed client session" warning. Call this once the
+    notebook is done; re-run the setup cells to sign in again afterwards.
+    """
+    if get_async_credential.cache_info().currsize:
+        await get_async_credential().close()
+    get_async_token_provider.cache_clear()
+    get_async_credential.cache_clear()